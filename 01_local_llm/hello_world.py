@@ -11,16 +11,6 @@ their reasoning process.
 """
 
 import argparse
-import os
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import utils
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils import get_llm, load_env_file, extract_reasoning_and_answer
-
-# Load environment variables from .env file if it exists
-load_env_file(__file__)
 
 
 def main():
@@ -33,8 +23,14 @@ def main():
     )
     args = parser.parse_args()
 
+    # Deferred imports: the LLM stack is only loaded once we know we need it
+    from utils import get_llm, get_config, load_env_file, extract_reasoning_and_answer_parts, cached_invoke
+
+    # Load environment variables from .env file if it exists
+    load_env_file()
+
     # Get provider info for display
-    provider = os.getenv("LLM_PROVIDER", "ollama")
+    provider = get_config().provider
 
     print("=" * 60)
     print("Step 1: Local LLM Hello World")
@@ -45,6 +41,8 @@ def main():
     print()
 
     # Get configured LLM instance from factory
+    # Tip: to pin the exact quantization (Q4_K_M), point OLLAMA_MODEL at the
+    # model built from models/Modelfile.workshop (see 01_local_llm.md)
     print(f"Initializing {provider} LLM...")
     llm = get_llm(prefer_thinking=args.thinking, temperature=0.0)
 
@@ -59,19 +57,20 @@ def main():
     print("Asking the model...")
     print("-" * 60)
 
-    # Invoke the model
-    response = llm.invoke(question)
+    # Invoke the model (repeated runs are served from the local response cache)
+    response = cached_invoke(llm, question)
 
     # Extract reasoning and answer using utility function
-    reasoning, final_answer = extract_reasoning_and_answer(response)
+    # (as lists of parts: they are printed one after the other, never joined)
+    reasoning_parts, answer_parts = extract_reasoning_and_answer_parts(response)
 
     if args.thinking:
         # The Thinking Trace (Reasoning)
         # For Ollama models: reasoning is in additional_kwargs
         # For Gemini 3 models: reasoning is in response.content as a list of dicts
-        if reasoning:
+        if reasoning_parts:
             print("### Thinking Trace ###")
-            print(reasoning)
+            print(*reasoning_parts, sep="\n")
             print("\n" + "=" * 60 + "\n")
         else:
             print("No reasoning trace found (Model might not have generated one).")
@@ -81,7 +80,7 @@ def main():
         print("### Final Answer ###")
 
     # Extract text content - handle both list format (Google) and string format (Ollama)
-    print(final_answer)
+    print(*answer_parts, sep="\n")
 
     print("-" * 60)
 
@@ -28,12 +28,11 @@ import os
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
-# Add parent directory to path to import utils
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Shared workshop helpers (utils.py, installed with `pip install -e .`)
 from utils import get_embeddings, load_env_file
 
 # Load environment variables from .env file if it exists
-load_env_file(__file__)
+load_env_file()
 
 from langchain_community.document_loaders import TextLoader
 from langchain_experimental.text_splitter import SemanticChunker
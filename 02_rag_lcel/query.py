@@ -30,12 +30,11 @@ import sys
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
-# Add parent directory to path to import utils
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Shared workshop helpers (utils.py, installed with `pip install -e .`)
 from utils import get_llm, get_embeddings, load_env_file, extract_reasoning_and_answer
 
 # Load environment variables from .env file if it exists
-load_env_file(__file__)
+load_env_file()
 
 from langchain_community.vectorstores import SQLiteVSS
 from langchain_core.prompts import ChatPromptTemplate
@@ -38,12 +38,11 @@ from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from pydantic import BaseModel, Field, ConfigDict
 
-# Add parent directory to path to import utils
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Shared workshop helpers (utils.py, installed with `pip install -e .`)
 from utils import get_llm, get_embeddings, load_env_file, extract_reasoning_and_answer
 
 # Load environment variables from .env file if it exists
-load_env_file(__file__)
+load_env_file()
 
 
 # ========================================
@@ -41,8 +41,7 @@ import os
 from pydantic import BaseModel, Field, ConfigDict
 import sqlite_vss
 
-# Add parent directory to path to import utils
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Shared workshop helpers (utils.py, installed with `pip install -e .`)
 from utils import get_llm, get_embeddings, load_env_file
 
 
@@ -820,7 +819,7 @@ def main():
     global llm
 
     # Load environment variables
-    load_env_file(__file__)
+    load_env_file()
 
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Network Multi-Agent System")
@@ -24,18 +24,13 @@ use libraries like python-a2a or LangGraph's A2A support.
 """
 
 import argparse
-import json
-import os
 import sys
-from pathlib import Path
-from typing import Dict, Any, List
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple
 
-# Add parent directory to path to import utils
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils import get_llm, load_env_file, extract_reasoning_and_answer
-
-# Load environment variables from .env file if it exists
-load_env_file(__file__)
+# utils (installed with `pip install -e .`), LangChain and asyncio are imported
+# lazily where they are used, so --help stays fast
 
 
 # ============================================================================
@@ -152,10 +147,102 @@ def create_a2a_response(
     return response
 
 
+def encode_a2a_message(message: Dict[str, Any], wire_format: str = "json") -> bytes:
+    """
+    Encode an A2A message (request or response) into bytes for the wire.
+
+    In a real A2A deployment every message travels over HTTP, so it has to be
+    serialized on each call. Two formats are supported:
+    - "json": compact JSON, the format required by JSON-RPC 2.0
+    - "msgpack": binary MessagePack, smaller on the wire, for agents that agree on it
+      (requires: pip install msgpack)
+
+    Args:
+        message: The A2A message, as built by create_a2a_task_request/create_a2a_response
+        wire_format: "json" (default) or "msgpack"
+
+    Returns:
+        The encoded message as bytes
+    """
+    if wire_format == "json":
+        from utils import jdumps_bytes
+
+        return jdumps_bytes(message)
+
+    elif wire_format == "msgpack":
+        try:
+            import msgpack
+        except ImportError:
+            raise RuntimeError(
+                "msgpack is required for wire_format='msgpack'.\n"
+                "Please install it:\n"
+                "  pip install msgpack"
+            ) from None
+        return msgpack.packb(message)
+
+    else:
+        raise ValueError(
+            f"Invalid wire_format value: '{wire_format}'\n"
+            f"Valid options: 'json', 'msgpack'"
+        )
+
+
+def create_a2a_task_request_bytes(
+    task_id: str,
+    capability: str,
+    parameters: Dict[str, Any],
+    requesting_agent: str,
+    wire_format: str = "json"
+) -> bytes:
+    """
+    Create an A2A task request and encode it for the wire.
+
+    Same arguments as create_a2a_task_request(), plus the wire format
+    (see encode_a2a_message()).
+    """
+    return encode_a2a_message(
+        create_a2a_task_request(task_id, capability, parameters, requesting_agent),
+        wire_format=wire_format
+    )
+
+
+def create_a2a_response_bytes(
+    task_id: str,
+    result: Any = None,
+    error: str = None,
+    wire_format: str = "json"
+) -> bytes:
+    """
+    Create an A2A task response and encode it for the wire.
+
+    Same arguments as create_a2a_response(), plus the wire format
+    (see encode_a2a_message()).
+    """
+    return encode_a2a_message(
+        create_a2a_response(task_id, result=result, error=error),
+        wire_format=wire_format
+    )
+
+
 # ============================================================================
 # Simulated A2A Agents
 # ============================================================================
 
+# Prompt templates used by the Research Agent's capabilities.
+# Defined once so the fixed part of each prompt is byte-identical across calls,
+# which keeps the prompt prefix reusable by the model server's cache.
+_RESEARCH_TMPL = "Provide a brief research summary about: {}"
+_SUMMARIZE_TMPL = "Summarize this text concisely: {}"
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of a JSON-like value (dicts, lists, scalars)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 class ResearchAgent:
     """
     A simulated A2A-compliant Research Agent.
@@ -165,6 +252,35 @@ class ResearchAgent:
     accepting HTTP requests at its endpoint.
     """
 
+    # System prompt sent first with every LLM call.
+    # It is a class-level constant so its bytes (and therefore its tokens) are
+    # identical across calls: the model server can reuse the already-processed
+    # prefix (KV cache) and only evaluate the variable part of each task.
+    SYSTEM_PREAMBLE = (
+        "You are the ACME Research Agent, a specialist agent reachable through the "
+        "Agent-to-Agent (A2A) protocol. Other agents (orchestrators, supervisors, "
+        "peers) delegate tasks to you; they are not humans chatting with you, and "
+        "your answer is embedded as-is in a JSON-RPC 2.0 result.\n"
+        "\n"
+        "Your capabilities:\n"
+        "- research_topic: produce a brief research summary about a topic\n"
+        "- answer_question: answer a question directly\n"
+        "- summarize_information: summarize a provided text concisely\n"
+        "\n"
+        "Guidelines:\n"
+        "- Be factual. If you do not know something (for example internal details "
+        "about ACME Corp that you were never given), say so instead of guessing.\n"
+        "- Lead with the key point, then add supporting details.\n"
+        "- Keep answers short: a few paragraphs or a short bullet list at most.\n"
+        "- Use plain text with simple markdown bullets; no greetings, no sign-offs, "
+        "no questions back to the requester.\n"
+        "- Answer in the language of the task."
+    )
+
+    # Upper bound on concurrent LLM calls in process_tasks() and aprocess_tasks()
+    # (keeps a local Ollama server well below its concurrency ceiling)
+    MAX_CONCURRENT_REQUESTS = 4
+
     def __init__(self, llm, agent_id: str = "research-agent-001"):
         self.agent_id = agent_id
         self.llm = llm
@@ -182,9 +298,34 @@ class ResearchAgent:
             endpoint=f"http://localhost:8000/a2a/{agent_id}"
         )
 
-    def get_agent_card(self) -> Dict[str, Any]:
-        """Return the Agent Card for capability discovery."""
-        return self.agent_card
+        # Capability lookup set: O(1) membership checks when validating requests
+        self._capability_set = frozenset(self.agent_card["capabilities"])
+
+        from utils import jdumps, jdumps_bytes
+
+        # Read-only copy handed out to other agents: discovery never needs a
+        # defensive copy, and nobody can modify this agent's card by accident.
+        # Nested values are frozen too (lists -> tuples, dicts -> read-only views),
+        # so e.g. card["capabilities"].append(...) fails instead of silently
+        # desynchronizing the card from _capability_set and the serialized JSON
+        self._agent_card_view = _freeze(self.agent_card)
+
+        # The Agent Card never changes, so serialize it once and reuse the string
+        # (for display) and the bytes (for the wire) for every discovery request
+        self.agent_card_json = jdumps(self.agent_card)
+        self._agent_card_bytes = jdumps_bytes(self.agent_card)
+
+    def get_agent_card(self) -> Mapping[str, Any]:
+        """Return a read-only view of the Agent Card for capability discovery."""
+        return self._agent_card_view
+
+    def get_agent_card_json(self) -> str:
+        """Return the Agent Card as the JSON document published to other agents."""
+        return self.agent_card_json
+
+    def get_agent_card_bytes(self) -> bytes:
+        """Return the Agent Card encoded as compact JSON bytes, ready to be sent."""
+        return self._agent_card_bytes
 
     def process_task(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -192,55 +333,167 @@ class ResearchAgent:
 
         In a real A2A system, this would be called via HTTP POST to the endpoint.
         """
+        response, prompt = self._validate(request)
+        if response is not None:
+            return response
+
+        from utils import cached_invoke, extract_reasoning_and_answer
+
+        try:
+            output = cached_invoke(self.llm, self._build_messages(prompt))
+            _, answer = extract_reasoning_and_answer(output)
+            return self._answer_response(request, answer)
+        except Exception as e:
+            return create_a2a_response(task_id=request.get("id"), error=str(e))
+
+    async def aprocess_task(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process an A2A task request without blocking the event loop.
+
+        Async twin of process_task(): the LLM call is awaited (llm.ainvoke),
+        so several tasks can be in flight at the same time.
+        """
+        response, prompt = self._validate(request)
+        if response is not None:
+            return response
+
+        from utils import cached_ainvoke, extract_reasoning_and_answer
+
+        try:
+            output = await cached_ainvoke(self.llm, self._build_messages(prompt))
+            _, answer = extract_reasoning_and_answer(output)
+            return self._answer_response(request, answer)
+        except Exception as e:
+            return create_a2a_response(task_id=request.get("id"), error=str(e))
+
+    def process_tasks(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process a fan-out of A2A task requests with a single llm.batch() call.
+
+        Requests are validated and turned into prompts first; all the prompts
+        are then sent to the LLM in one batch (at most MAX_CONCURRENT_REQUESTS
+        in flight, cached prompts are answered locally) and the answers are
+        fanned back out into JSON-RPC responses. Responses are returned in the
+        same order as the requests.
+        """
+        from utils import cached_batch, extract_reasoning_and_answer
+
+        responses: List[Dict[str, Any] | None] = [None] * len(requests)
+        pending = []  # index in requests of the tasks needing the LLM
+        prompts = []
+
+        for index, request in enumerate(requests):
+            responses[index], prompt = self._validate(request)
+            if prompt is not None:
+                pending.append(index)
+                prompts.append(self._build_messages(prompt))
+
+        if prompts:
+            # return_exceptions keeps one failed task from failing the whole batch
+            outputs = cached_batch(
+                self.llm,
+                prompts,
+                config={"max_concurrency": self.MAX_CONCURRENT_REQUESTS},
+                return_exceptions=True,
+            )
+            for index, output in zip(pending, outputs):
+                request = requests[index]
+                if isinstance(output, Exception):
+                    responses[index] = create_a2a_response(
+                        task_id=request.get("id"), error=str(output)
+                    )
+                else:
+                    _, answer = extract_reasoning_and_answer(output)
+                    responses[index] = self._answer_response(request, answer)
+
+        return responses
+
+    async def aprocess_tasks(
+        self, requests: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several independent A2A task requests concurrently.
+
+        The tasks run together with asyncio.gather (at most
+        MAX_CONCURRENT_REQUESTS LLM calls in flight). Responses are returned
+        in the same order as the requests.
+        """
+        import asyncio
+
+        # Created here so the semaphore belongs to the running event loop
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def bounded(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aprocess_task(request)
+
+        return await asyncio.gather(*(bounded(request) for request in requests))
+
+    def _validate(
+        self, request: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any] | None, str | None]:
+        """
+        Check a task request and build its LLM prompt.
+
+        Returns (response, None) when the request is answered without the LLM
+        (unsupported or not implemented capability), (None, prompt) otherwise.
+        """
         task_id = request.get("id")
         method = request.get("method")
-        params = request.get("params", {})
 
         # Check if we support this capability
-        if method not in self.agent_card["capabilities"]:
+        if method not in self._capability_set:
             return create_a2a_response(
                 task_id=task_id,
                 error=f"Capability '{method}' not supported by this agent"
-            )
-
-        # Process based on capability
-        try:
-            if method == "research_topic":
-                topic = params.get("topic", "")
-                result = self._research_topic(topic)
-            elif method == "answer_question":
-                question = params.get("question", "")
-                result = self._answer_question(question)
-            elif method == "summarize_information":
-                text = params.get("text", "")
-                result = self._summarize(text)
-            else:
-                result = {"message": "Capability recognized but not implemented"}
-
-            return create_a2a_response(task_id=task_id, result=result)
-
-        except Exception as e:
-            return create_a2a_response(task_id=task_id, error=str(e))
+            ), None
 
-    def _research_topic(self, topic: str) -> Dict[str, str]:
-        """Research a topic using the LLM."""
-        prompt = f"Provide a brief research summary about: {topic}"
-        response = self.llm.invoke(prompt)
-        _, answer = extract_reasoning_and_answer(response)
-        return {"topic": topic, "summary": answer}
+        prompt = self._build_prompt(method, request.get("params", {}))
+        if prompt is None:
+            return create_a2a_response(
+                task_id=task_id,
+                result={"message": "Capability recognized but not implemented"}
+            ), None
+        return None, prompt
 
-    def _answer_question(self, question: str) -> Dict[str, str]:
-        """Answer a question using the LLM."""
-        response = self.llm.invoke(question)
-        _, answer = extract_reasoning_and_answer(response)
-        return {"question": question, "answer": answer}
+    def _answer_response(self, request: Dict[str, Any], answer: str) -> Dict[str, Any]:
+        """Wrap the LLM answer to a validated request into a JSON-RPC response."""
+        method = request.get("method")
+        params = request.get("params", {})
+        return create_a2a_response(
+            task_id=request.get("id"), result=self._build_result(method, params, answer)
+        )
 
-    def _summarize(self, text: str) -> Dict[str, str]:
-        """Summarize text using the LLM."""
-        prompt = f"Summarize this text concisely: {text}"
-        response = self.llm.invoke(prompt)
-        _, summary = extract_reasoning_and_answer(response)
-        return {"original_length": len(text), "summary": summary}
+    def _build_prompt(self, method: str, params: Dict[str, Any]) -> str | None:
+        """Build the LLM prompt for a capability (None if not implemented)."""
+        if method == "research_topic":
+            return _RESEARCH_TMPL.format(params.get("topic", ""))
+        elif method == "answer_question":
+            return params.get("question", "")
+        elif method == "summarize_information":
+            return _SUMMARIZE_TMPL.format(params.get("text", ""))
+        return None
+
+    def _build_messages(self, prompt: str) -> List[Any]:
+        """Prepend the stable system preamble to the task-specific prompt."""
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        return [
+            SystemMessage(content=self.SYSTEM_PREAMBLE),
+            HumanMessage(content=prompt),
+        ]
+
+    def _build_result(
+        self, method: str, params: Dict[str, Any], answer: str
+    ) -> Dict[str, Any]:
+        """Shape the LLM answer into the capability's result payload."""
+        if method == "research_topic":
+            return {"topic": params.get("topic", ""), "summary": answer}
+        elif method == "answer_question":
+            return {"question": params.get("question", ""), "answer": answer}
+        else:
+            text = params.get("text", "")
+            return {"original_length": len(text), "summary": answer}
 
 
 class OrchestratorAgent:
@@ -251,11 +504,19 @@ class OrchestratorAgent:
     It demonstrates the client side of A2A communication.
     """
 
-    def __init__(self, agent_id: str = "orchestrator-001"):
+    def __init__(self, agent_id: str = "orchestrator-001", embeddings=None):
         self.agent_id = agent_id
         self.discovered_agents = {}  # agent_id -> agent_card
+        self._capability_index = {}  # capability -> [agent_id, ...]
 
-    def discover_agent(self, agent_card: Dict[str, Any]) -> None:
+        # Optional embeddings model (e.g. from get_embeddings()) enabling
+        # delegate_by_intent(): capabilities are embedded once at discovery
+        self.embeddings = embeddings
+        self._cap_matrix = None  # (n_capabilities, dim) unit vectors
+        self._cap_names = []  # capability of each matrix row
+        self._cap_agent_ids = []  # agent providing each matrix row
+
+    def discover_agent(self, agent_card: Mapping[str, Any]) -> None:
         """
         Discover a remote agent by receiving its Agent Card.
 
@@ -265,7 +526,28 @@ class OrchestratorAgent:
         - Service discovery protocols
         """
         agent_id = agent_card["agentId"]
+        capabilities = list(agent_card["capabilities"])
+
+        # Re-discovery of a known agent: nothing to index again if its card
+        # lists the same capabilities, otherwise drop the outdated entries first
+        previous = self.discovered_agents.get(agent_id)
+        unchanged = (
+            previous is not None and list(previous["capabilities"]) == capabilities
+        )
+        if previous is not None and not unchanged:
+            self._forget_capabilities(agent_id)
         self.discovered_agents[agent_id] = agent_card
+
+        if not unchanged:
+            # Reverse index: which agents provide each capability
+            for capability in capabilities:
+                providers = self._capability_index.setdefault(capability, [])
+                if agent_id not in providers:
+                    providers.append(agent_id)
+
+            if self.embeddings is not None:
+                self._embed_capabilities(agent_id, capabilities)
+
         print(f"✓ Discovered agent: {agent_card['name']} ({agent_id})")
         print(f"  Capabilities: {', '.join(agent_card['capabilities'])}")
         print(f"  Endpoint: {agent_card['endpoint']}")
@@ -299,40 +581,209 @@ class OrchestratorAgent:
 
         return request
 
+    def delegate_tasks(
+        self, delegations: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Delegate several tasks in one shot.
+
+        Each delegation is a dict with the keyword arguments of delegate_task()
+        (target_agent_id, capability, parameters and optionally task_id).
+        The resulting requests can be processed together by the target agent,
+        e.g. with ResearchAgent.process_tasks(requests).
+        """
+        return [self.delegate_task(**delegation) for delegation in delegations]
+
+    def _forget_capabilities(self, agent_id: str) -> None:
+        """Remove an agent from the capability index and the capability matrix."""
+        for capability in list(self._capability_index):
+            providers = self._capability_index[capability]
+            if agent_id in providers:
+                providers.remove(agent_id)
+                if not providers:
+                    del self._capability_index[capability]
+
+        if self._cap_matrix is not None:
+            keep = [i for i, owner in enumerate(self._cap_agent_ids) if owner != agent_id]
+            self._cap_matrix = self._cap_matrix[keep] if keep else None
+            self._cap_names = [self._cap_names[i] for i in keep]
+            self._cap_agent_ids = [self._cap_agent_ids[i] for i in keep]
+
+    def _embed_capabilities(self, agent_id: str, capabilities: List[str]) -> None:
+        """Embed an agent's capability names and add them to the capability matrix."""
+        if not capabilities:
+            return
+
+        import numpy as np
+
+        # "research_topic" -> "research topic": closer to natural language goals
+        texts = [capability.replace("_", " ") for capability in capabilities]
+        vectors = np.asarray(self.embeddings.embed_documents(texts), dtype=np.float32)
+        # Normalize once so a dot product with a normalized query is the cosine similarity.
+        # A zero vector (degenerate embedding) is left as is: it scores 0 instead of NaN
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms > 0, norms, 1.0)
+
+        if self._cap_matrix is None:
+            self._cap_matrix = vectors
+        else:
+            self._cap_matrix = np.vstack([self._cap_matrix, vectors])
+        self._cap_names.extend(capabilities)
+        self._cap_agent_ids.extend([agent_id] * len(capabilities))
+
+    def delegate_by_intent(
+        self,
+        goal: str,
+        parameters: Dict[str, Any],
+        task_id: str = "task-001"
+    ) -> Dict[str, Any]:
+        """
+        Delegate a task described in natural language to the best-matching capability.
+
+        The goal is embedded and compared with every discovered capability in a
+        single matrix-vector product (cosine similarity); the task is delegated to
+        the agent providing the closest capability. Requires an embeddings model
+        (see __init__).
+        """
+        if self.embeddings is None or self._cap_matrix is None:
+            return {
+                "error": "Intent-based delegation needs an embeddings model and discovered agents",
+                "discovered_agents": list(self.discovered_agents.keys())
+            }
+
+        import numpy as np
+
+        query = np.asarray(self.embeddings.embed_query(goal), dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return {
+                "error": f"Could not embed the goal: {goal!r}",
+                "discovered_agents": list(self.discovered_agents.keys())
+            }
+        scores = self._cap_matrix @ (query / norm)
+        best = int(scores.argmax())
+
+        return self.delegate_task(
+            target_agent_id=self._cap_agent_ids[best],
+            capability=self._cap_names[best],
+            parameters=parameters,
+            task_id=task_id
+        )
+
+    def delegate_by_capability(
+        self,
+        capability: str,
+        parameters: Dict[str, Any],
+        task_id: str = "task-001"
+    ) -> Dict[str, Any]:
+        """
+        Delegate a task to whichever discovered agent provides a capability.
+
+        The orchestrator doesn't need to know agent IDs up front: it looks the
+        capability up in its index and picks the first agent that advertised it.
+        """
+        providers = self._capability_index.get(capability)
+        if not providers:
+            return {
+                "error": f"No discovered agent provides capability '{capability}'",
+                "discovered_capabilities": list(self._capability_index.keys())
+            }
+
+        return self.delegate_task(
+            target_agent_id=providers[0],
+            capability=capability,
+            parameters=parameters,
+            task_id=task_id
+        )
+
 
 # ============================================================================
 # Demo Scenarios
 # ============================================================================
 
+# The static parts of the demo's output are kept as module-level text blocks
+# and written in one call each, instead of one print() per line.
+
+# Opening explanation printed before the demo starts
+_INTRO_TEXT = "\n".join([
+    "=" * 70,
+    "Step 6: Agent-to-Agent (A2A) Protocol Demo",
+    "=" * 70,
+    "",
+    "📋 What is A2A Protocol?",
+    "-" * 70,
+    "The Agent-to-Agent (A2A) Protocol is an open standard that enables",
+    "AI agents to discover each other's capabilities and collaborate",
+    "across different frameworks, vendors, and platforms.",
+    "",
+    "Key Features:",
+    "  • Standardized Communication: JSON-RPC 2.0 over HTTP/HTTPS",
+    "  • Capability Discovery: Agent Cards describe what agents can do",
+    "  • Framework Agnostic: Works with LangGraph, CrewAI, custom agents",
+    "  • Industry Support: Backed by Linux Foundation, Google, and 50+ partners",
+    "",
+    "Relationship to MCP:",
+    "  • MCP: Agent-to-Tool communication (agents connect to tools)",
+    "  • A2A: Agent-to-Agent communication (agents connect to agents)",
+    "=" * 70,
+    "",
+    "",
+])
+
+# Closing summary printed after the demo
+_TAKEAWAYS_TEXT = "\n".join([
+    "=" * 70,
+    "Key Takeaways",
+    "=" * 70,
+    "",
+    "✓ Agent Cards enable capability discovery",
+    "  → Agents advertise what they can do via JSON metadata",
+    "",
+    "✓ JSON-RPC 2.0 provides standardized communication",
+    "  → Request format: method, params, id",
+    "  → Response format: result or error",
+    "",
+    "✓ A2A enables agent ecosystems",
+    "  → Agents from different frameworks can collaborate",
+    "  → Orchestrators can discover and delegate to specialized agents",
+    "  → Enterprise systems can compose multiple AI capabilities",
+    "",
+    "Real-World A2A Implementations:",
+    "  • python-a2a library: Python implementation of A2A protocol",
+    "  • LangGraph A2A support: Native A2A integration",
+    "  • Google Agent Development Kit (ADK): A2A-based agent framework",
+    "",
+    "Comparison to Other Patterns in This Workshop:",
+    "  • Step 3 (ReAct): Single agent with tools",
+    "  • Step 4 (Supervisor): Centralized multi-agent coordination",
+    "  • Step 5 (Network): Peer-to-peer agent collaboration",
+    "  • Step 6 (A2A): *Cross-framework* agent interoperability",
+    "",
+    "Next Steps:",
+    "  • Explore python-a2a library: github.com/themanojdesai/python-a2a",
+    "  • Read A2A specification: a2a-protocol.org/latest/specification",
+    "  • Try LangGraph A2A: docs.langchain.com/langsmith/server-a2a",
+    "=" * 70,
+    "",
+])
+
+
 def run_basic_demo(use_thinking: bool = False):
     """
     Demonstrate basic A2A protocol concepts with agent discovery and task delegation.
     """
-    print("=" * 70)
-    print("Step 6: Agent-to-Agent (A2A) Protocol Demo")
-    print("=" * 70)
-    print()
+    # Deferred imports: the LLM stack is only loaded once the demo actually runs
+    import asyncio
 
-    print("📋 What is A2A Protocol?")
-    print("-" * 70)
-    print("The Agent-to-Agent (A2A) Protocol is an open standard that enables")
-    print("AI agents to discover each other's capabilities and collaborate")
-    print("across different frameworks, vendors, and platforms.")
-    print()
-    print("Key Features:")
-    print("  • Standardized Communication: JSON-RPC 2.0 over HTTP/HTTPS")
-    print("  • Capability Discovery: Agent Cards describe what agents can do")
-    print("  • Framework Agnostic: Works with LangGraph, CrewAI, custom agents")
-    print("  • Industry Support: Backed by Linux Foundation, Google, and 50+ partners")
-    print()
-    print("Relationship to MCP:")
-    print("  • MCP: Agent-to-Tool communication (agents connect to tools)")
-    print("  • A2A: Agent-to-Agent communication (agents connect to agents)")
-    print("=" * 70)
-    print()
+    from utils import get_llm, get_config, load_env_file, jdumps
+
+    # Load environment variables from .env file if it exists
+    load_env_file()
+
+    sys.stdout.write(_INTRO_TEXT)
 
     # Initialize LLM
-    provider = os.getenv("LLM_PROVIDER", "ollama")
+    provider = get_config().provider
     print(f"Initializing {provider} LLM...")
     llm = get_llm(prefer_thinking=use_thinking, temperature=0.7)
     print(f"✓ Connected to {llm.model}")
@@ -361,7 +812,7 @@ def run_basic_demo(use_thinking: bool = False):
     print("The Research Agent publishes its Agent Card:")
     print()
     agent_card = research_agent.get_agent_card()
-    print(json.dumps(agent_card, indent=2))
+    print(research_agent.get_agent_card_json())
     print()
 
     print("The Orchestrator discovers the Research Agent:")
@@ -391,29 +842,8 @@ def run_basic_demo(use_thinking: bool = False):
     )
 
     print("A2A Request (JSON-RPC 2.0 format):")
-    print(json.dumps(task_request, indent=2))
-    print()
-
-    # Research Agent processes the request
-    print("Research Agent processing request...")
-    task_response = research_agent.process_task(task_request)
-
+    print(jdumps(task_request))
     print()
-    print("A2A Response (JSON-RPC 2.0 format):")
-    print(json.dumps(task_response, indent=2))
-    print()
-
-    # Extract and display the answer
-    if "result" in task_response:
-        result = task_response["result"]
-        print("-" * 70)
-        print("Answer from Research Agent:")
-        print("-" * 70)
-        print(result.get("answer", "No answer provided"))
-        print()
-    elif "error" in task_response:
-        print(f"❌ Error: {task_response['error']['message']}")
-        print()
 
     # ========================================================================
     # STEP 4: Another Example - Research Topic
@@ -435,8 +865,33 @@ def run_basic_demo(use_thinking: bool = False):
         task_id="demo-task-002"
     )
 
-    print("Research Agent processing request...")
-    task_response_2 = research_agent.process_task(task_request_2)
+    print("A2A Request (JSON-RPC 2.0 format):")
+    print(jdumps(task_request_2))
+    print()
+
+    # Both requests are independent, so the Research Agent processes them
+    # concurrently: the two LLM calls overlap instead of running back-to-back
+    print("Research Agent processing both requests concurrently...")
+    task_response, task_response_2 = asyncio.run(
+        research_agent.aprocess_tasks([task_request, task_request_2])
+    )
+
+    print()
+    print("A2A Response to demo-task-001 (JSON-RPC 2.0 format):")
+    print(jdumps(task_response))
+    print()
+
+    # Extract and display the answer
+    if "result" in task_response:
+        result = task_response["result"]
+        print("-" * 70)
+        print("Answer from Research Agent:")
+        print("-" * 70)
+        print(result.get("answer", "No answer provided"))
+        print()
+    elif "error" in task_response:
+        print(f"❌ Error: {task_response['error']['message']}")
+        print()
 
     if "result" in task_response_2:
         result = task_response_2["result"]
@@ -450,38 +905,7 @@ def run_basic_demo(use_thinking: bool = False):
     # ========================================================================
     # Summary
     # ========================================================================
-    print("=" * 70)
-    print("Key Takeaways")
-    print("=" * 70)
-    print()
-    print("✓ Agent Cards enable capability discovery")
-    print("  → Agents advertise what they can do via JSON metadata")
-    print()
-    print("✓ JSON-RPC 2.0 provides standardized communication")
-    print("  → Request format: method, params, id")
-    print("  → Response format: result or error")
-    print()
-    print("✓ A2A enables agent ecosystems")
-    print("  → Agents from different frameworks can collaborate")
-    print("  → Orchestrators can discover and delegate to specialized agents")
-    print("  → Enterprise systems can compose multiple AI capabilities")
-    print()
-    print("Real-World A2A Implementations:")
-    print("  • python-a2a library: Python implementation of A2A protocol")
-    print("  • LangGraph A2A support: Native A2A integration")
-    print("  • Google Agent Development Kit (ADK): A2A-based agent framework")
-    print()
-    print("Comparison to Other Patterns in This Workshop:")
-    print("  • Step 3 (ReAct): Single agent with tools")
-    print("  • Step 4 (Supervisor): Centralized multi-agent coordination")
-    print("  • Step 5 (Network): Peer-to-peer agent collaboration")
-    print("  • Step 6 (A2A): *Cross-framework* agent interoperability")
-    print()
-    print("Next Steps:")
-    print("  • Explore python-a2a library: github.com/themanojdesai/python-a2a")
-    print("  • Read A2A specification: a2a-protocol.org/latest/specification")
-    print("  • Try LangGraph A2A: docs.langchain.com/langsmith/server-a2a")
-    print("=" * 70)
+    sys.stdout.write(_TAKEAWAYS_TEXT)
 
 
 def main():
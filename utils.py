@@ -3,14 +3,164 @@
 Utility functions for the LLMs Workshop.
 
 This module provides helper functions used across multiple demo scripts.
+
+Provider SDKs (langchain_ollama, langchain_google_genai) are imported inside the
+factory functions, so a script only loads the SDK of the provider it uses.
 """
 
-from langchain_ollama import ChatOllama, OllamaEmbeddings
-from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+import functools
+import hashlib
+import json
 import os
 import subprocess
+import threading
+import warnings
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    # Optional: Rust-backed JSON serializer, used by jdumps() when installed
+    import orjson
+except ImportError:
+    orjson = None
+
+# Repository root (utils.py lives there; `pip install -e .` keeps it that way)
+_REPO_ROOT = Path(__file__).resolve().parent
+_DEFAULT_ENV_PATH = os.path.join(_REPO_ROOT, ".env")
+
+# .env files (absolute path strings) already loaded in this process (see load_env_file())
+_loaded_envs: set[str] = set()
+
+# python-dotenv's load_dotenv, imported on first use: _NOT_IMPORTED until then,
+# None if python-dotenv is not installed (so the import is only attempted once)
+_NOT_IMPORTED = object()
+_dotenv_loader = _NOT_IMPORTED
+
+# Location of the persistent LLM response cache (see enable_llm_cache())
+_LLM_CACHE_DIR = Path.home() / ".cache" / "llms-workshop"
+_llm_cache_db = None  # sqlite3 connection, opened by enable_llm_cache()
+_llm_cache_failed = False  # opening the cache failed: call the model directly
+_llm_cache_lock = threading.Lock()
+
+# LLM fields left out of the response cache key: client objects and their
+# options (connection plumbing, not model settings) and secrets
+_LLM_CACHE_KEY_SKIP_SUFFIXES = (
+    "client",
+    "client_kwargs",
+    "client_options",
+    "_key",
+    "credentials",
+)
+
+# Shared HTTP transport for Ollama clients (see _get_ollama_transport())
+_ollama_transport = None
+
+# Snapshot of the environment configuration (see get_config())
+_config = None
+
+# Provider names (values of LLM_PROVIDER) and the keys/tags looked up in model
+# responses, spelled once for the dispatch tables and the extraction hot path.
+# Identifier-like literals are interned by CPython already, so comparisons stay ==
+_PROV_OLLAMA = "ollama"
+_PROV_GOOGLE = "google"
+_KEY_REASONING = "reasoning_content"
+_TYPE_KEY = "type"
+_TYPE_THINKING = "thinking"
+_TYPE_TEXT = "text"
+
+# Error raised by get_llm() / get_embeddings() when LLM_PROVIDER=google has no key
+_GOOGLE_KEY_ERROR = (
+    "GOOGLE_API_KEY environment variable is required when LLM_PROVIDER=google.\n"
+    "Setup instructions:\n"
+    "1. Get an API key from https://ai.google.dev/\n"
+    "2. Create a .env file in the repository root:\n"
+    "   LLM_PROVIDER=google\n"
+    "   GOOGLE_API_KEY=your_api_key_here\n"
+    "3. Or export the environment variable:\n"
+    "   export GOOGLE_API_KEY=your_api_key_here"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class WorkshopConfig:
+    """
+    Immutable snapshot of the environment variables used across the workshop.
+
+    Reading the environment once and passing this object around avoids repeated
+    os.getenv() lookups and gives every script the same view of the configuration.
+    Use get_config() to obtain the current snapshot.
+    """
+
+    provider: str
+    ollama_host: str
+    ollama_model: str | None
+    ollama_thinking_model: str | None
+    google_model: str
+    google_thinking_model: str | None
+    # Kept out of repr() so printing the config never leaks the key
+    google_api_key: str | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_env(cls) -> "WorkshopConfig":
+        """
+        Build a snapshot from the current environment variables.
+
+        Values are stripped once here, so callers compare them as they are.
+        A variable that is unset or blank counts as not set (None, or the default).
+        """
+        env = os.environ
+
+        def read(name):
+            return (env.get(name) or "").strip() or None
+
+        return cls(
+            provider=(read("LLM_PROVIDER") or _PROV_OLLAMA).lower(),
+            ollama_host=read("OLLAMA_HOST") or "localhost:11434",
+            ollama_model=read("OLLAMA_MODEL"),
+            ollama_thinking_model=read("OLLAMA_THINKING_MODEL"),
+            google_model=read("GOOGLE_MODEL") or "gemini-3-flash-preview",
+            google_thinking_model=read("GOOGLE_THINKING_MODEL"),
+            google_api_key=read("GOOGLE_API_KEY"),
+        )
+
+
+def get_config() -> WorkshopConfig:
+    """
+    Return the workshop configuration, read from the environment on first use.
+
+    The snapshot is taken lazily so that values from the .env file are included
+    (load_env_file() takes a fresh snapshot when it loads a file, see refresh_env_cache()).
+
+    Returns:
+        WorkshopConfig: The current configuration snapshot
+
+    Example:
+        >>> load_env_file()
+        >>> provider = get_config().provider  # "ollama" or "google"
+    """
+    global _config
+
+    if _config is None:
+        _config = WorkshopConfig.from_env()
+    return _config
+
+
+def refresh_env_cache() -> WorkshopConfig:
+    """
+    Re-read the environment and replace the cached configuration snapshot.
+
+    load_env_file() calls this after loading a .env file. Call it yourself if you
+    change os.environ at runtime (e.g. switch LLM_PROVIDER in a notebook) and want
+    get_llm() / get_embeddings() to see the new values.
+
+    Returns:
+        WorkshopConfig: The new configuration snapshot
+    """
+    global _config
+
+    _config = WorkshopConfig.from_env()
+    return _config
+
 
 def load_env_file(reference_path=None):
     """
@@ -22,42 +172,256 @@ def load_env_file(reference_path=None):
 
     Args:
         reference_path: Optional path to use as reference (typically __file__ from
-                       the calling script). If None, uses utils.py location as reference.
-                       The function looks for .env in the repository root by going up
-                       one level from the reference path's parent directory.
+                       a script in a subdirectory). If None (the default), the
+                       repository root next to utils.py is used.
+                       When given, the function looks for .env in the repository root
+                       by going up one level from the reference path's parent directory.
 
     Returns:
         bool: True if .env file was loaded successfully, False otherwise
 
+    Note:
+        Each .env file is parsed at most once per process: later calls for the same
+        file return True straight away. Call refresh_env_cache() if you need to pick
+        up environment changes made after the first load.
+
     Example:
-        >>> # Load .env from repository root using calling script's location
-        >>> # (for scripts in subdirectories like 01_local_llm/, 02_rag_lcel/, etc.)
-        >>> load_env_file(__file__)
-        >>> 
-        >>> # Load .env from repository root using utils.py location (default)
+        >>> # Load .env from repository root (default, used by all workshop scripts)
         >>> load_env_file()
+        >>> 
+        >>> # Load .env relative to a script located in a subdirectory
+        >>> load_env_file(__file__)
     """
-    try:
-        from dotenv import load_dotenv
-    except ImportError:
-        # python-dotenv not installed, will rely on environment variables
-        return False
-
     if reference_path is None:
-        # Use utils.py location as reference (utils.py is at repo root)
-        # For scripts at repo root, go up one level; for utils.py itself, use current dir
-        repo_root = Path(__file__).parent
-        env_path = repo_root / ".env"
+        # utils.py lives at the repository root (resolved once at import)
+        env_path = _DEFAULT_ENV_PATH
     else:
         # For scripts in subdirectories, go up two levels: script -> subdir -> repo root
-        # This matches the pattern: Path(__file__).parent.parent / ".env"
-        repo_root = Path(reference_path).parent.parent
-        env_path = repo_root / ".env"
+        # Same as Path(__file__).parent.parent / ".env", with plain string operations
+        # (no Path objects to build on every call)
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(reference_path)))
+        env_path = os.path.join(repo_root, ".env")
 
-    if env_path.exists():
-        load_dotenv(env_path)
+    # Already loaded by an earlier call: skip the stat, the read and the parse
+    if env_path in _loaded_envs:
         return True
-    return False
+
+    global _dotenv_loader
+
+    if _dotenv_loader is _NOT_IMPORTED:
+        try:
+            from dotenv import load_dotenv as _dotenv_loader
+        except ImportError:
+            # python-dotenv not installed, will rely on environment variables
+            _dotenv_loader = None
+    if _dotenv_loader is None:
+        return False
+
+    # No exists() pre-check: load_dotenv() returns False for a missing file,
+    # so a single attempt saves one stat() call
+    try:
+        loaded = _dotenv_loader(env_path)
+    except OSError:
+        # Unreadable file (permissions, directory named .env, ...)
+        return False
+
+    if loaded:
+        _loaded_envs.add(env_path)
+        # The environment changed: snapshot it again for get_config()
+        refresh_env_cache()
+    return bool(loaded)
+
+
+def _get_ollama_transport():
+    """
+    Return the HTTP transport shared by all Ollama clients in this process.
+
+    The transport owns the connection pool: sharing it means every ChatOllama
+    instance reuses the same keep-alive connections to `ollama serve` instead of
+    opening a new TCP connection per client. It is created on first use and
+    closed when the interpreter exits.
+    """
+    global _ollama_transport
+
+    if _ollama_transport is None:
+        import atexit
+        import httpx
+
+        _ollama_transport = httpx.HTTPTransport(
+            retries=3,
+            limits=httpx.Limits(
+                max_keepalive_connections=40,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+        )
+        atexit.register(_ollama_transport.close)
+    return _ollama_transport
+
+
+def _prewarm_ollama_model(llm):
+    """
+    Ask Ollama to load the model into memory in a background thread.
+
+    The first request to a model that isn't loaded yet stalls for several seconds
+    while Ollama reads the weights. Sending an empty generate request (which only
+    loads the model) right after construction overlaps that stall with whatever
+    the script does before its first real call. This is best effort: any error is
+    ignored, and the first real call loads the model if warming didn't.
+    """
+
+    def load_model():
+        try:
+            from ollama import Client
+
+            client = Client(host=llm.base_url, transport=_get_ollama_transport())
+            # A generate request without a prompt only loads the model
+            client.generate(model=llm.model)
+        except Exception:
+            pass
+
+    threading.Thread(target=load_model, daemon=True).start()
+
+
+def _build_ollama_llm(config, prefer_thinking, temperature, **kwargs):
+    """Build a ChatOllama instance (the "ollama" branch of get_llm())."""
+    # Pick the model in straight-line code: OLLAMA_THINKING_MODEL (only when
+    # prefer_thinking=True), then OLLAMA_MODEL, then auto-detection.
+    # Config values are already stripped (None when unset)
+    thinking_model = config.ollama_thinking_model
+    model_override = config.ollama_model
+    if prefer_thinking and thinking_model:
+        model_name = thinking_model
+    elif model_override:
+        model_name = model_override
+    else:
+        model_name = get_available_model(
+            prefer_thinking=prefer_thinking, use_cloud=False
+        )
+
+    # Reasoning traces only enabled for thinking models
+    # Only enable reasoning if we actually have a thinking model
+    enable_reasoning = bool(
+        prefer_thinking and thinking_model and model_name == thinking_model
+    )
+
+    from langchain_ollama import ChatOllama
+
+    # Route every Ollama client through the same process-wide connection pool,
+    # so repeated calls (and repeated get_llm() calls) reuse keep-alive connections
+    sync_client_kwargs = {
+        "transport": _get_ollama_transport(),
+        **kwargs.pop("sync_client_kwargs", {}),
+    }
+    llm = ChatOllama(
+        model=model_name,
+        temperature=temperature,
+        reasoning=enable_reasoning,
+        sync_client_kwargs=sync_client_kwargs,
+        **kwargs,
+    )
+    # Start loading the weights now, while the script prints its banner
+    _prewarm_ollama_model(llm)
+    return llm
+
+
+def _require_google_key(config) -> str:
+    """Return the Google API key from the config, or raise RuntimeError with setup hints."""
+    api_key = config.google_api_key
+    if not api_key:
+        raise RuntimeError(_GOOGLE_KEY_ERROR)
+    return api_key
+
+
+def _build_google_llm(config, prefer_thinking, temperature, **kwargs):
+    """Build a ChatGoogleGenerativeAI instance (the "google" branch of get_llm())."""
+    api_key = _require_google_key(config)
+
+    # Get model name
+    model_name = config.google_model
+
+    # Check if this is a thinking model and enable reasoning
+    # Reasoning traces only enabled for thinking models
+    # Only enable reasoning if we actually have a thinking model
+    thinking_model = config.google_thinking_model
+    enable_reasoning = (
+        prefer_thinking and thinking_model and model_name == thinking_model
+    )
+
+    # Return configured ChatGoogleGenerativeAI instance, thinking variant or not
+    build = _google_llm_thinking if enable_reasoning else _google_llm_plain
+    return build(model_name, temperature, api_key, **kwargs)
+
+
+def _google_llm_thinking(model_name, temperature, api_key, **kwargs):
+    """Build a ChatGoogleGenerativeAI instance with reasoning traces enabled."""
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    # For Gemini 3 models, thinking/reasoning is enabled through thinking_level parameter
+    # Note: reasoning parameter is not supported in ChatGoogleGenerativeAI
+    # thinking_level can be "minimal", "low", "medium", or "high"
+    # Also enable include_thoughts to expose reasoning traces
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        temperature=temperature,
+        google_api_key=api_key,
+        thinking_level="medium",
+        include_thoughts=True,
+        **kwargs,
+    )
+
+
+def _google_llm_plain(model_name, temperature, api_key, **kwargs):
+    """Build a ChatGoogleGenerativeAI instance without reasoning traces."""
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        temperature=temperature,
+        google_api_key=api_key,
+        **kwargs,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_cached(builder, config, args, kwargs_key):
+    """Call a builder once per distinct (config, arguments) and keep the result."""
+    return builder(config, *args, **dict(kwargs_key))
+
+
+def _build(builder, config, *args, **kwargs):
+    """
+    Return the instance built by builder for this configuration, reusing it if possible.
+
+    Model clients are safe to share and costly to create (HTTP connection pool,
+    gRPC channel, Ollama pre-warm), so the same instance is returned for the same
+    configuration snapshot and arguments. The keyword arguments are folded into a
+    sorted tuple to be usable as a cache key.
+    """
+    kwargs_key = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_key)
+    except TypeError:
+        # Unhashable option (e.g. a list of callbacks): build a fresh instance
+        return builder(config, *args, **kwargs)
+    return _build_cached(builder, config, args, kwargs_key)
+
+
+def reset_model_cache():
+    """
+    Forget the LLM and embeddings instances returned so far by get_llm() / get_embeddings().
+
+    The next call builds a new instance. This does not touch the response cache
+    set up by enable_llm_cache().
+    """
+    _build_cached.cache_clear()
+
+
+# Provider name -> LLM builder. Adding a provider means adding a builder here
+_LLM_BUILDERS = {
+    _PROV_OLLAMA: _build_ollama_llm,
+    _PROV_GOOGLE: _build_google_llm,
+}
 
 
 def get_llm(prefer_thinking: bool = False, temperature: float = 0.0, **kwargs):
@@ -94,6 +458,11 @@ def get_llm(prefer_thinking: bool = False, temperature: float = 0.0, **kwargs):
         RuntimeError: If configuration is invalid or required dependencies are missing
         ValueError: If LLM_PROVIDER has an invalid value
 
+    Note:
+        Calls with the same configuration and arguments return the same instance
+        (unless a keyword argument is unhashable). Use reset_model_cache() to get
+        a fresh one.
+
     Example:
         >>> # Use default Ollama provider
         >>> llm = get_llm(temperature=0.0)
@@ -104,106 +473,52 @@ def get_llm(prefer_thinking: bool = False, temperature: float = 0.0, **kwargs):
         >>> response = llm.invoke("Explain why the sky is blue")
         >>> reasoning = response.additional_kwargs.get("reasoning_content")
     """
-    provider = os.getenv("LLM_PROVIDER", "ollama").lower()
+    # Environment variables are read once into a snapshot (see get_config())
+    config = get_config()
 
-    if provider == "ollama":
-        # Get model name - check OLLAMA_THINKING_MODEL first if prefer_thinking is True
-        if prefer_thinking:
-            # When prefer_thinking=True, prioritize OLLAMA_THINKING_MODEL
-            thinking_model = os.getenv("OLLAMA_THINKING_MODEL", "").strip()
-            if thinking_model:
-                model_name = thinking_model
-            else:
-                # Fall back to OLLAMA_MODEL if OLLAMA_THINKING_MODEL not set
-                model_name_override = os.getenv("OLLAMA_MODEL")
-                if model_name_override:
-                    model_name = model_name_override
-                else:
-                    # Fall back to auto-detection if neither is set
-                    model_name = get_available_model(
-                        prefer_thinking=prefer_thinking, use_cloud=False
-                    )
-        else:
-            # When prefer_thinking=False, use OLLAMA_MODEL if set, otherwise auto-detect
-            model_name_override = os.getenv("OLLAMA_MODEL")
-            if model_name_override:
-                model_name = model_name_override
-            else:
-                # Auto-detect available model based on preference
-                model_name = get_available_model(
-                    prefer_thinking=prefer_thinking, use_cloud=False
-                )
-
-        # Return configured ChatOllama instance
-        # Reasoning traces only enabled for thinking models
-        # Only enable reasoning if we actually have a thinking model
-        thinking_model = os.getenv("OLLAMA_THINKING_MODEL", "").strip()
-        enable_reasoning = (
-            prefer_thinking and thinking_model and model_name == thinking_model
-        )
-        return ChatOllama(
-            model=model_name,
-            temperature=temperature,
-            reasoning=enable_reasoning,
-            **kwargs,
+    builder = _LLM_BUILDERS.get(config.provider)
+    if builder is None:
+        raise ValueError(
+            f"Invalid LLM_PROVIDER value: '{config.provider}'\n"
+            f"Valid options: 'ollama', 'google'\n"
+            f"Set LLM_PROVIDER environment variable to one of these values."
         )
+    return _build(builder, config, prefer_thinking, temperature, **kwargs)
 
-    elif provider == "google":
-        # Check for API key
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            raise RuntimeError(
-                "GOOGLE_API_KEY environment variable is required when LLM_PROVIDER=google.\n"
-                "Setup instructions:\n"
-                "1. Get an API key from https://ai.google.dev/\n"
-                "2. Create a .env file in the repository root:\n"
-                "   LLM_PROVIDER=google\n"
-                "   GOOGLE_API_KEY=your_api_key_here\n"
-                "3. Or export the environment variable:\n"
-                "   export GOOGLE_API_KEY=your_api_key_here"
-            )
 
-        # Get model name
-        model_name = os.getenv("GOOGLE_MODEL", "gemini-3-flash-preview")
+def _build_ollama_embeddings(config, **kwargs):
+    """Build an OllamaEmbeddings instance (the "ollama" branch of get_embeddings())."""
+    from langchain_ollama import OllamaEmbeddings
 
-        # Check if this is a thinking model and enable reasoning
-        # Reasoning traces only enabled for thinking models
-        # Only enable reasoning if we actually have a thinking model
-        thinking_model = os.getenv("GOOGLE_THINKING_MODEL", "").strip()
-        enable_reasoning = (
-            prefer_thinking and thinking_model and model_name == thinking_model
-        )
+    # Return configured OllamaEmbeddings instance
+    # nomic-embed-text is optimized for text embedding tasks
+    # Produces high-quality vectors
+    return OllamaEmbeddings(
+        model="nomic-embed-text",  # Specialized embedding model from Ollama
+        **kwargs,
+    )
 
-        # Return configured ChatGoogleGenerativeAI instance
-        # For Gemini 3 models, thinking/reasoning is enabled through thinking_level parameter
-        # Note: reasoning parameter is not supported in ChatGoogleGenerativeAI
-        # For Gemini 3 Flash Preview, use thinking_level to control reasoning depth
-        if enable_reasoning:
-            # Enable thinking for Gemini 3 models
-            # thinking_level can be "minimal", "low", "medium", or "high"
-            # Also enable include_thoughts to expose reasoning traces
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                temperature=temperature,
-                google_api_key=api_key,
-                thinking_level="medium",
-                include_thoughts=True,
-                **kwargs,
-            )
-        else:
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                temperature=temperature,
-                google_api_key=api_key,
-                **kwargs,
-            )
 
-    else:
-        raise ValueError(
-            f"Invalid LLM_PROVIDER value: '{provider}'\n"
-            f"Valid options: 'ollama', 'google'\n"
-            f"Set LLM_PROVIDER environment variable to one of these values."
-        )
+def _build_google_embeddings(config, **kwargs):
+    """Build a GoogleGenerativeAIEmbeddings instance (the "google" branch of get_embeddings())."""
+    api_key = _require_google_key(config)
+
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    # Return configured GoogleGenerativeAIEmbeddings instance
+    # gemini-embedding-001 is optimized for semantic search
+    return GoogleGenerativeAIEmbeddings(
+        model="gemini-embedding-001",
+        google_api_key=api_key,
+        **kwargs,
+    )
+
+
+# Provider name -> embeddings builder (same keys as _LLM_BUILDERS)
+_EMB_BUILDERS = {
+    _PROV_OLLAMA: _build_ollama_embeddings,
+    _PROV_GOOGLE: _build_google_embeddings,
+}
 
 
 def get_embeddings(**kwargs):
@@ -228,6 +543,10 @@ def get_embeddings(**kwargs):
         RuntimeError: If configuration is invalid or required dependencies are missing
         ValueError: If LLM_PROVIDER has an invalid value
 
+    Note:
+        Like get_llm(), the same instance is returned for the same configuration
+        and arguments (see reset_model_cache()).
+
     Example:
         >>> # Use default Ollama provider
         >>> embeddings = get_embeddings()
@@ -238,68 +557,82 @@ def get_embeddings(**kwargs):
         >>> embeddings = get_embeddings()
         >>> vectors = embeddings.embed_documents(["doc1", "doc2"])
     """
-    provider = os.getenv("LLM_PROVIDER", "ollama").lower()
-
-    if provider == "ollama":
-        # Return configured OllamaEmbeddings instance
-        # nomic-embed-text is optimized for text embedding tasks
-        # Produces high-quality vectors
-        return OllamaEmbeddings(
-            model="nomic-embed-text",  # Specialized embedding model from Ollama
-            **kwargs,
-        )
+    config = get_config()
 
-    elif provider == "google":
-        # Check for API key
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            raise RuntimeError(
-                "GOOGLE_API_KEY environment variable is required when LLM_PROVIDER=google.\n"
-                "Setup instructions:\n"
-                "1. Get an API key from https://ai.google.dev/\n"
-                "2. Create a .env file in the repository root:\n"
-                "   LLM_PROVIDER=google\n"
-                "   GOOGLE_API_KEY=your_api_key_here\n"
-                "3. Or export the environment variable:\n"
-                "   export GOOGLE_API_KEY=your_api_key_here"
-            )
-
-        # Return configured GoogleGenerativeAIEmbeddings instance
-        # gemini-embedding-001 is optimized for semantic search
-        return GoogleGenerativeAIEmbeddings(
-            model="gemini-embedding-001",
-            google_api_key=api_key,
-            **kwargs,
-        )
-
-    else:
+    builder = _EMB_BUILDERS.get(config.provider)
+    if builder is None:
         raise ValueError(
-            f"Invalid LLM_PROVIDER value: '{provider}'\n"
+            f"Invalid LLM_PROVIDER value: '{config.provider}'\n"
             f"Valid options: 'ollama', 'google'\n"
             f"Set LLM_PROVIDER environment variable to one of these values."
         )
+    return _build(builder, config, **kwargs)
+
+
+def _list_ollama_models():
+    """
+    Return the set of (lowercased) names of the models available in Ollama.
 
+    Asks the Ollama server directly through its REST API (GET /api/tags), which
+    avoids starting an `ollama list` process. If the server can't be reached over
+    HTTP, falls back to the CLI, whose errors tell whether Ollama is installed
+    and running.
 
+    Raises:
+        subprocess.CalledProcessError: If the `ollama list` fallback fails
+        FileNotFoundError: If the fallback can't find the `ollama` command
+    """
+    import urllib.error
+    import urllib.request
+
+    host = get_config().ollama_host
+    base_url = host if "://" in host else f"http://{host}"
+    try:
+        tags_url = f"{base_url.rstrip('/')}/api/tags"
+        with urllib.request.urlopen(tags_url, timeout=2) as response:
+            tags = json.load(response)
+        return {model["name"].lower() for model in tags.get("models", [])}
+    except (urllib.error.URLError, OSError, ValueError, KeyError):
+        # Server unreachable or unexpected answer: ask the CLI instead
+        pass
+
+    # Read stdout as bytes: model names are ASCII, so only the names get decoded
+    # rather than the whole table
+    result = subprocess.run(["ollama", "list"], capture_output=True, check=True)
+    # One model per line after the "NAME ID SIZE MODIFIED" header; keep the name
+    return {
+        line.split(None, 1)[0].decode("ascii", "replace")
+        for line in result.stdout.lower().splitlines()[1:]
+        if line.strip()
+    }
+
+
+@functools.lru_cache(maxsize=None)
 def get_available_model(prefer_thinking: bool = False, use_cloud: bool = False) -> str:
     """
-    Get an available Ollama model, checking for qwen3 first, then lama3.1.
+    Get an available Ollama model, checking for qwen3 first, then llama3.1.
 
-    This function checks which models are available in Ollama and returns
+    This function asks Ollama which models are available and returns
     the first one found from the preferred list. It tries qwen3 first
     as it's a thinking model with better reasoning capabilities, then falls
-    back to lama3.1 if qwen3 is not available.
+    back to llama3.1 if qwen3 is not available.
 
     Args:
         prefer_thinking: If True, always return qwen3 if available.
-                        If False, return lama3.1 if available, or qwen3 as fallback.
+                        If False, return llama3.1 if available, or qwen3 as fallback.
         use_cloud: If True, return a Google model name instead of checking Ollama.
 
     Returns:
-        str: The name of an available model ("qwen3" or "lama3.1")
+        str: The name of an available model ("qwen3" or "llama3.1")
 
     Raises:
         RuntimeError: If neither model is available in Ollama
 
+    Note:
+        Results are memoized per (prefer_thinking, use_cloud), so Ollama is queried
+        at most once per process for each combination (errors are not cached).
+        Call get_available_model.cache_clear() to query it again.
+
     Example:
         >>> model = get_available_model(prefer_thinking=True)
         >>> llm = ChatOllama(model=model)
@@ -309,15 +642,11 @@ def get_available_model(prefer_thinking: bool = False, use_cloud: bool = False)
     else:
         try:
             # Get list of available models from Ollama
-            result = subprocess.run(
-                ["ollama", "list"], capture_output=True, text=True, check=True
-            )
-
-            available_models = result.stdout.lower()
+            available_models = _list_ollama_models()
 
-            # Check which models are available
-            has_qwen = "qwen3" in available_models
-            has_llama = "lama3.1" in available_models or "lama3.1" in available_models
+            # Check which models are available (names carry a tag, e.g. "qwen3:8b")
+            has_qwen = any(name.startswith("qwen3") for name in available_models)
+            has_llama = any(name.startswith("llama3.1") for name in available_models)
 
             # Determine which model to return based on preference and availability
             if prefer_thinking:
@@ -332,18 +661,18 @@ def get_available_model(prefer_thinking: bool = False, use_cloud: bool = False)
             else:
                 # For non-thinking use cases, prefer llama3.1 but fall back to qwen3
                 if has_llama:
-                    return "lama3.1"
+                    return "llama3.1"
                 else:
                     raise RuntimeError(
-                        "lama3.1 is required when prefer_thinking=False, but it is not available in Ollama.\n"
-                        "Please install lama3.1:\n"
-                        "  ollama pull lama3.1"
+                        "llama3.1 is required when prefer_thinking=False, but it is not available in Ollama.\n"
+                        "Please install llama3.1:\n"
+                        "  ollama pull llama3.1"
                     )
 
         except subprocess.CalledProcessError as e:
             raise RuntimeError(
                 f"Failed to query Ollama models: {e}\n"
-                "Make sure Ollama is installed and running."
+                "Make sure Ollama is installed and running (ollama serve)."
             ) from e
         except FileNotFoundError:
             raise RuntimeError(
@@ -352,6 +681,373 @@ def get_available_model(prefer_thinking: bool = False, use_cloud: bool = False)
             ) from None
 
 
+def enable_llm_cache(database_path=None):
+    """
+    Enable the persistent LLM response cache used by cached_invoke().
+
+    Repeated prompts (like the hardcoded demo questions) are answered from a local
+    SQLite file instead of going back to the model, so re-running a demo returns
+    instantly. Entries are keyed on the model settings (class, model name,
+    temperature, reasoning/thinking options) together with the exact messages,
+    which means changing the model, the provider, the temperature or the thinking
+    mode triggers a fresh call.
+
+    Environment Variables:
+        LLM_CACHE: Set to "0", "false" or "no" to disable caching (default: enabled)
+
+    Args:
+        database_path: Optional path to the SQLite cache file.
+                       Defaults to ~/.cache/llms-workshop/llm_cache.db
+
+    Returns:
+        bool: True if the cache is enabled, False if it was disabled via LLM_CACHE
+              or could not be opened (e.g. read-only home directory). The cache
+              is best effort: on failure a warning is emitted once and
+              cached_invoke() simply calls the model.
+
+    Example:
+        >>> enable_llm_cache()
+        >>> cached_invoke(llm, "Who is the CEO of ACME Corp?")  # calls the model
+        >>> cached_invoke(llm, "Who is the CEO of ACME Corp?")  # served from the cache
+    """
+    global _llm_cache_db, _llm_cache_failed
+
+    if os.getenv("LLM_CACHE", "1").strip().lower() in ("0", "false", "no"):
+        return False
+
+    # cached_invoke() runs on worker threads in batched code paths:
+    # check and open under the lock so only one connection is ever created
+    with _llm_cache_lock:
+        if _llm_cache_db is not None:
+            return True
+        if _llm_cache_failed:
+            return False
+
+        import sqlite3
+
+        if database_path is None:
+            database_path = _LLM_CACHE_DIR / "llm_cache.db"
+        try:
+            Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+            # check_same_thread=False: access is serialized by _llm_cache_lock;
+            # isolation_level=None commits every write
+            db = sqlite3.connect(
+                str(database_path), check_same_thread=False, isolation_level=None
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+        except (OSError, sqlite3.Error) as e:
+            # Caching is an optimization: never let it break a demo
+            _llm_cache_failed = True
+            warnings.warn(
+                f"LLM response cache disabled, could not open {database_path}: {e}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return False
+
+        _llm_cache_db = db
+        return True
+
+
+def _llm_cache_key(llm, prompt):
+    """
+    Return the cache key of a call: sha256 of the model parameters and the messages.
+
+    LangChain's own cache key for ChatOllama leaves out the model name, the
+    temperature and the reasoning flag, so different models would share entries.
+    The key is therefore built from every field of the LLM (model, temperature,
+    num_predict, format, base_url, ...), minus client objects and secrets, so
+    any option passed through get_llm(**kwargs) gets its own entries.
+    """
+    from langchain_core.messages import convert_to_messages, messages_to_dict
+
+    params = {
+        name: value
+        for name, value in llm.model_dump().items()
+        if not name.endswith(_LLM_CACHE_KEY_SKIP_SUFFIXES)
+    }
+    payload = {
+        "class": type(llm).__name__,
+        "params": params,
+        "messages": (
+            prompt if isinstance(prompt, str) else messages_to_dict(convert_to_messages(prompt))
+        ),
+    }
+    # Values JSON can't represent (SecretStr, enums of other libraries, ...) are
+    # replaced by their type name: deterministic, and never the secret itself
+    serialized = json.dumps(
+        payload, sort_keys=True, default=lambda value: type(value).__qualname__
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _llm_cache_lookup(key):
+    """Return the cached response message for key, or None on a miss."""
+    import sqlite3
+
+    try:
+        with _llm_cache_lock:
+            row = _llm_cache_db.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        # Unreadable cache (locked, corrupted, ...): treat as a miss
+        return None
+    if row is None:
+        return None
+
+    from langchain_core.messages import messages_from_dict
+
+    return messages_from_dict([json.loads(row[0])])[0]
+
+
+def _llm_cache_store(key, response):
+    """Persist a response message under key (best effort: write errors are ignored)."""
+    import sqlite3
+
+    from langchain_core.messages import message_to_dict
+
+    serialized = json.dumps(message_to_dict(response), default=str)
+    try:
+        with _llm_cache_lock:
+            _llm_cache_db.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (key, serialized),
+            )
+    except sqlite3.Error:
+        # Read-only or full disk: the response is still returned to the caller
+        pass
+
+
+def cached_invoke(llm, prompt):
+    """
+    Invoke an LLM through the persistent response cache.
+
+    This is a drop-in replacement for llm.invoke(prompt): the first call for a
+    given model configuration and prompt hits the model, subsequent identical
+    calls (even across runs) are served from the SQLite cache set up by
+    enable_llm_cache().
+
+    Args:
+        llm: LLM instance (from get_llm())
+        prompt: A string or a list of messages, as accepted by llm.invoke()
+
+    Returns:
+        The model response message (AIMessage), as llm.invoke() returns it
+
+    Example:
+        >>> llm = get_llm()
+        >>> response = cached_invoke(llm, "Who is the CEO of ACME Corp?")
+    """
+    if not enable_llm_cache():
+        return llm.invoke(prompt)
+
+    key = _llm_cache_key(llm, prompt)
+    response = _llm_cache_lookup(key)
+    if response is None:
+        response = llm.invoke(prompt)
+        _llm_cache_store(key, response)
+    return response
+
+
+async def cached_ainvoke(llm, prompt):
+    """
+    Async twin of cached_invoke(): await llm.ainvoke(prompt) through the cache.
+
+    Args:
+        llm: LLM instance (from get_llm())
+        prompt: A string or a list of messages, as accepted by llm.ainvoke()
+
+    Returns:
+        The model response message (AIMessage), as llm.ainvoke() returns it
+
+    Example:
+        >>> response = await cached_ainvoke(llm, "Who is the CEO of ACME Corp?")
+    """
+    if not enable_llm_cache():
+        return await llm.ainvoke(prompt)
+
+    key = _llm_cache_key(llm, prompt)
+    response = _llm_cache_lookup(key)
+    if response is None:
+        response = await llm.ainvoke(prompt)
+        _llm_cache_store(key, response)
+    return response
+
+
+def cached_batch(llm, prompts, config=None, return_exceptions=False):
+    """
+    Batch twin of cached_invoke(): only the prompts missing from the cache are
+    sent to the model, in a single llm.batch() call.
+
+    Args:
+        llm: LLM instance (from get_llm())
+        prompts: List of prompts (strings or lists of messages)
+        config: Optional runnable config passed to llm.batch()
+                (e.g. {"max_concurrency": 4})
+        return_exceptions: If True, a failed prompt yields its exception in the
+                           results instead of failing the whole batch
+                           (failures are not cached)
+
+    Returns:
+        list: One response per prompt, in the same order as prompts
+
+    Example:
+        >>> responses = cached_batch(llm, ["Hello", "Bonjour"])
+    """
+    if not enable_llm_cache():
+        return llm.batch(prompts, config=config, return_exceptions=return_exceptions)
+
+    keys = [_llm_cache_key(llm, prompt) for prompt in prompts]
+    results = [_llm_cache_lookup(key) for key in keys]
+    misses = [index for index, result in enumerate(results) if result is None]
+
+    if misses:
+        outputs = llm.batch(
+            [prompts[index] for index in misses],
+            config=config,
+            return_exceptions=return_exceptions,
+        )
+        for index, output in zip(misses, outputs):
+            results[index] = output
+            if not isinstance(output, Exception):
+                _llm_cache_store(keys[index], output)
+    return results
+
+
+def jdumps(obj) -> str:
+    """
+    Serialize an object to an indented (2 spaces) JSON string.
+
+    Uses orjson when it is installed (pip install orjson), which is several times
+    faster than the standard library, and falls back to json.dumps otherwise.
+    Both produce the same indented layout.
+
+    Args:
+        obj: JSON-serializable object (dicts, lists, strings, numbers...)
+
+    Returns:
+        str: The indented JSON document
+
+    Example:
+        >>> print(jdumps({"jsonrpc": "2.0", "id": "task-001"}))
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    # ensure_ascii=False: write non-ASCII text (e.g. French answers) as is, like orjson
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def jdumps_bytes(obj) -> bytes:
+    """
+    Serialize an object to compact JSON bytes, ready to be sent over the wire.
+
+    Uses orjson when it is installed and falls back to json.dumps otherwise.
+    Unlike jdumps(), the output has no indentation or extra whitespace.
+
+    Args:
+        obj: JSON-serializable object (dicts, lists, strings, numbers...)
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document
+
+    Example:
+        >>> jdumps_bytes({"jsonrpc": "2.0", "id": "task-001"})
+        b'{"jsonrpc":"2.0","id":"task-001"}'
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _extract_parts_from_str(content, response):
+    """Ollama format: content is the answer, reasoning (if any) is in additional_kwargs."""
+    reasoning = response.additional_kwargs.get(_KEY_REASONING)
+    return ([reasoning] if reasoning else []), [content]
+
+
+def _extract_parts_from_list(content, response):
+    """Gemini 3 format: content is a list of {"type": "thinking" | "text", ...} dicts."""
+    thinking_parts = []
+    text_parts = []
+
+    # This applies to both thinking and non-thinking modes.
+    # Route each part on its "type" tag: tag -> (payload key, bound append).
+    # A single dict lookup per part replaces trying each case in turn;
+    # unknown tags, parts without a payload and non-dict parts are ignored
+    routes = {
+        _TYPE_THINKING: (_TYPE_THINKING, thinking_parts.append),
+        _TYPE_TEXT: (_TYPE_TEXT, text_parts.append),
+    }
+    for part in content:
+        if isinstance(part, dict):
+            route = routes.get(part.get(_TYPE_KEY))
+            if route is not None:
+                key, append = route
+                if key in part:
+                    append(part[key])
+
+    # No non-empty thinking part: the reasoning may still be in additional_kwargs
+    # (a {"type": "thinking", "thinking": ""} part must not hide it)
+    if not any(thinking_parts):
+        reasoning = response.additional_kwargs.get(_KEY_REASONING)
+        thinking_parts = [reasoning] if reasoning else []
+
+    if not text_parts:
+        # No text part (e.g. only a thinking trace): the answer is empty, rather
+        # than the Python repr of the parts list
+        text_parts.append("")
+
+    return thinking_parts, text_parts
+
+
+def _extract_parts_fallback(content, response):
+    """Any other content type: convert it to a string."""
+    reasoning = response.additional_kwargs.get(_KEY_REASONING)
+    return ([reasoning] if reasoning else []), [str(content)]
+
+
+# Exact content type -> extractor (anything else goes to _extract_parts_fallback)
+_PART_EXTRACTORS = {
+    str: _extract_parts_from_str,
+    list: _extract_parts_from_list,
+}
+
+
+def extract_reasoning_and_answer_parts(response):
+    """
+    Extract the reasoning trace and final answer from an LLM response as parts.
+
+    Same as extract_reasoning_and_answer(), but the pieces are returned as lists
+    of the strings found in the response instead of being joined. Callers that
+    only print the result can write the parts one after the other, without
+    building a copy of a (possibly very long) thinking trace first.
+
+    Args:
+        response: LLM response object (from ChatOllama or ChatGoogleGenerativeAI)
+
+    Returns:
+        tuple: (reasoning_parts, answer_parts) where:
+            - reasoning_parts: list of str - reasoning trace pieces (empty if none)
+            - answer_parts: list of str - final answer pieces (never empty; [""]
+              when a list-format response has no text part)
+
+    Example:
+        >>> response = llm.invoke("Who is the CEO?")
+        >>> reasoning_parts, answer_parts = extract_reasoning_and_answer_parts(response)
+        >>> if reasoning_parts:
+        ...     print(*reasoning_parts, sep="\n")
+        >>> print(*answer_parts, sep="\n")
+    """
+    content = response.content
+    # One dict lookup on the exact content type picks the extractor
+    extract = _PART_EXTRACTORS.get(type(content), _extract_parts_fallback)
+    return extract(content, response)
+
+
 def extract_reasoning_and_answer(response):
     """
     Extract reasoning trace and final answer from an LLM response.
@@ -378,39 +1074,21 @@ def extract_reasoning_and_answer(response):
         >>> print("### Final Answer ###")
         >>> print(answer)
     """
-    reasoning = None
-    final_answer = None
-    
-    # Check for Gemini 3 format (content as list of dicts)
-    # This applies to both thinking and non-thinking modes
-    if isinstance(response.content, list):
-        thinking_parts = []
-        text_parts = []
-        for part in response.content:
-            if isinstance(part, dict):
-                if part.get("type") == "thinking":
-                    thinking_parts.append(part.get("thinking", ""))
-                elif part.get("type") == "text":
-                    text_parts.append(part.get("text", ""))
-        if thinking_parts:
-            reasoning = "\n".join(thinking_parts)
-        if text_parts:
-            final_answer = "\n".join(text_parts)
-    
-    # For Ollama models: reasoning is in additional_kwargs
-    if not reasoning:
-        reasoning = response.additional_kwargs.get("reasoning_content")
-    
-    # Extract text content - handle both list format (Google) and string format (Ollama)
-    if final_answer is None:
-        if isinstance(response.content, str):
-            final_answer = response.content
-        elif isinstance(response.content, list):
-            # Already handled above, but fallback in case of unexpected format
-            final_answer = str(response.content)
-        else:
-            # Fallback: convert to string
-            final_answer = str(response.content)
-    
-    return reasoning, final_answer
+    content = response.content
+
+    # Fast path for Ollama models: return the string content as is
+    if type(content) is str:
+        return response.additional_kwargs.get(_KEY_REASONING) or None, content
+
+    reasoning_parts, answer_parts = extract_reasoning_and_answer_parts(response)
+    # Most responses have a single part: use it directly instead of joining
+    if not reasoning_parts:
+        reasoning = None
+    elif len(reasoning_parts) == 1:
+        reasoning = reasoning_parts[0]
+    else:
+        reasoning = "\n".join(reasoning_parts)
+    if len(answer_parts) == 1:
+        return reasoning, answer_parts[0]
+    return reasoning, "\n".join(answer_parts)
 